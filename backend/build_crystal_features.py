@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Build the reference feature matrix for the local crystal pre-classifier
+Reads labeled images laid out as <images_dir>/<Crystal Name>/*.jpg and writes
+the features and labels to an .npz file loaded by enhanced_backend at startup
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from enhanced_backend import CRYSTAL_FEATURES_PATH, FEATURE_VERSION, extract_image_features
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp"}
+
+def collect_labeled_images(images_dir: str) -> list[tuple[str, str]]:
+    """(path, label) pairs, one label per subdirectory"""
+    labeled = []
+    for label in sorted(os.listdir(images_dir)):
+        label_dir = os.path.join(images_dir, label)
+        if not os.path.isdir(label_dir):
+            continue
+        for filename in sorted(os.listdir(label_dir)):
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
+                labeled.append((os.path.join(label_dir, filename), label))
+    return labeled
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("images_dir", help="Directory with one subdirectory of images per crystal")
+    parser.add_argument("-o", "--output", default=CRYSTAL_FEATURES_PATH, help="Output .npz path")
+    args = parser.parse_args()
+
+    labeled = collect_labeled_images(args.images_dir)
+    if not labeled:
+        print(f"❌ No labeled images found in {args.images_dir}")
+        return 1
+
+    features, labels = [], []
+    start = time.perf_counter()
+    for path, label in labeled:
+        try:
+            with open(path, "rb") as image_file:
+                features.append(extract_image_features(image_file.read()))
+            labels.append(label)
+        except Exception as e:
+            print(f"⚠️  Skipping {path}: {e}")
+    elapsed = time.perf_counter() - start
+
+    if not features:
+        print(f"❌ None of the {len(labeled)} images in {args.images_dir} could be decoded")
+        return 1
+
+    np.savez_compressed(
+        args.output,
+        features=np.stack(features),
+        labels=np.array(labels),
+        feature_version=np.array(FEATURE_VERSION),
+    )
+
+    print(f"💎 {len(features)} images, {len(set(labels))} crystals")
+    print(f"⏱️  {elapsed / len(features) * 1000:.1f}ms per image")
+    print(f"✅ Wrote {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the Crystal Grimoire backend
+Measures module import time and time-to-first-/health for a fresh process,
+and exits non-zero when either regresses past its configured budget
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Budgets in seconds, overridable from the environment (e.g. in CI)
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_IMPORT_BUDGET", "0.6"))
+FIRST_HEALTH_BUDGET_SECONDS = float(os.getenv("STARTUP_FIRST_HEALTH_BUDGET", "1.0"))
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import enhanced_backend; "
+    "print(time.perf_counter() - t)"
+)
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _benchmark_env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("ENVIRONMENT", "benchmark")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def measure_import() -> float:
+    """Import time of enhanced_backend in a fresh interpreter"""
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        env=_benchmark_env(),
+        stderr=subprocess.DEVNULL,
+    )
+    return float(output.decode().strip().splitlines()[-1])
+
+def measure_first_health(timeout: float) -> float:
+    """Seconds from process spawn until the first successful /health response"""
+    port = _free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "enhanced_backend:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=_benchmark_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Server exited early with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=timeout) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError(f"No healthy response within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_SECONDS)
+    parser.add_argument("--health-budget", type=float, default=FIRST_HEALTH_BUDGET_SECONDS)
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-run startup timeout")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache once so runs measure startup, not compilation
+    measure_import()
+
+    import_times = [measure_import() for _ in range(args.runs)]
+    health_times = [measure_first_health(args.timeout) for _ in range(args.runs)]
+
+    import_median = statistics.median(import_times)
+    health_median = statistics.median(health_times)
+
+    print(f"🔮 Cold-start benchmark ({args.runs} runs, median)")
+    print(f"📦 Import:        {import_median * 1000:7.1f}ms (budget {args.import_budget * 1000:.0f}ms)")
+    print(f"💓 First /health: {health_median * 1000:7.1f}ms (budget {args.health_budget * 1000:.0f}ms)")
+
+    failures = []
+    if import_median > args.import_budget:
+        failures.append("import")
+    if health_median > args.health_budget:
+        failures.append("first /health")
+
+    if failures:
+        print(f"❌ Startup budget exceeded: {', '.join(failures)}")
+        return 1
+
+    print("✅ Startup within budget")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
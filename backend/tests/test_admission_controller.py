@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from enhanced_backend import PRIORITY_ANONYMOUS, PRIORITY_AUTHENTICATED, AdmissionController
+
+async def _hold(controller: AdmissionController, priority: int, release: asyncio.Event, deadline=None):
+    async with controller.slot(priority, deadline):
+        await release.wait()
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+def test_full_queue_sheds_new_requests():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1, max_wait=5)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        waiter = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        await _settle()
+        
+        with pytest.raises(HTTPException) as excinfo:
+            await _hold(controller, PRIORITY_ANONYMOUS, release)
+        assert excinfo.value.status_code == 503
+        assert "Retry-After" in excinfo.value.headers
+        assert controller.stats["shed_reasons"]["queue_full"] == 1
+        
+        release.set()
+        await asyncio.gather(holder, waiter)
+        assert controller.in_flight == 0
+    
+    asyncio.run(scenario())
+
+def test_authenticated_request_preempts_anonymous_waiter():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1, max_wait=5)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        anonymous = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        await _settle()
+        authenticated = asyncio.create_task(_hold(controller, PRIORITY_AUTHENTICATED, release))
+        await _settle()
+        
+        with pytest.raises(HTTPException) as excinfo:
+            await anonymous
+        assert excinfo.value.status_code == 503
+        assert controller.stats["shed_reasons"]["preempted"] == 1
+        
+        release.set()
+        await asyncio.gather(holder, authenticated)
+        assert controller.stats["admitted"] == {"authenticated": 1, "anonymous": 1}
+        assert controller.in_flight == 0
+    
+    asyncio.run(scenario())
+
+def test_waiter_is_shed_after_max_wait():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=5, max_wait=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        await _settle()
+        
+        with pytest.raises(HTTPException) as excinfo:
+            await _hold(controller, PRIORITY_ANONYMOUS, release)
+        assert excinfo.value.status_code == 503
+        assert controller.stats["shed_reasons"]["timeout"] == 1
+        assert controller.queue_depth == 0
+        
+        release.set()
+        await holder
+        assert controller.in_flight == 0
+    
+    asyncio.run(scenario())
+
+def test_cancelled_waiter_gives_back_its_slot():
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=5, max_wait=5)
+        release = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, release))
+        waiting = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, asyncio.Event()))
+        granted = asyncio.create_task(_hold(controller, PRIORITY_ANONYMOUS, asyncio.Event()))
+        await _settle()
+        
+        # Cancelled while queued
+        waiting.cancel()
+        await _settle()
+        
+        # Cancelled after the slot was handed over but before it resumed
+        release.set()
+        await holder
+        granted.cancel()
+        await asyncio.gather(waiting, granted, return_exceptions=True)
+        
+        assert controller.in_flight == 0
+        assert controller.queue_depth == 0
+    
+    asyncio.run(scenario())
+
+@pytest.mark.parametrize("deadline", [-5.0, 0.0, 0.05])
+def test_unmeetable_deadline_is_shed_even_with_free_slots(deadline):
+    async def scenario():
+        controller = AdmissionController(max_concurrent=4, max_queue=5, max_wait=5)
+        controller._record_service_time(0.1)
+        
+        with pytest.raises(HTTPException) as excinfo:
+            await _hold(controller, PRIORITY_ANONYMOUS, asyncio.Event(), deadline=deadline)
+        assert excinfo.value.status_code == 503
+        assert controller.stats["shed_reasons"]["deadline"] == 1
+        assert controller.in_flight == 0
+    
+    asyncio.run(scenario())
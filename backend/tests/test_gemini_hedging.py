@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+import enhanced_backend
+from enhanced_backend import GeminiHedgePolicy, gemini_post
+
+PRIMARY_URL = "http://gemini.test/models/primary:generateContent"
+HEDGE_URL = "http://gemini.test/models/hedge:generateContent"
+
+@pytest.fixture(autouse=True)
+def hedging(monkeypatch):
+    monkeypatch.setattr(enhanced_backend, "GEMINI_HEDGING", True)
+    monkeypatch.setattr(enhanced_backend, "GEMINI_URL", PRIMARY_URL)
+    monkeypatch.setattr(enhanced_backend, "GEMINI_HEDGE_URL", HEDGE_URL)
+
+def _policy(tokens: float = 5.0, budget: float = 0.0) -> GeminiHedgePolicy:
+    """A warmed-up policy that hedges after 50ms"""
+    policy = GeminiHedgePolicy(percentile=95, min_delay=0.05, budget=budget)
+    for _ in range(GeminiHedgePolicy.MIN_SAMPLES):
+        policy.record_latency(0.01)
+    policy.tokens = tokens
+    return policy
+
+def _fake_gemini(upstreams: dict):
+    """Stand-in upstream: path -> (delay seconds, status); records calls and cancellations"""
+    calls, cancelled = [], []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        name = "hedge" if request.url.path.startswith("/models/hedge") else "primary"
+        calls.append(name)
+        delay, status = upstreams[name]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        return httpx.Response(status, json={"from": name})
+    
+    return httpx.MockTransport(handler), calls, cancelled
+
+def _post(transport, policy):
+    async def run():
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await gemini_post(client, {}, policy)
+    return asyncio.run(run())
+
+def test_hedge_wins_and_primary_is_cancelled():
+    transport, calls, cancelled = _fake_gemini({"primary": (2.0, 200), "hedge": (0.01, 200)})
+    policy = _policy()
+    
+    response = _post(transport, policy)
+    
+    assert response.json() == {"from": "hedge"}
+    assert calls == ["primary", "hedge"]
+    assert cancelled == ["primary"]
+    assert policy.stats["hedge_wins"] == 1
+    # The win's elapsed time stays in the window as a lower bound for the primary
+    assert max(policy.latencies) >= 0.05
+
+def test_primary_beating_its_hedge_is_sampled_as_slow():
+    transport, calls, cancelled = _fake_gemini({"primary": (0.1, 200), "hedge": (2.0, 200)})
+    policy = _policy()
+    
+    response = _post(transport, policy)
+    
+    assert response.json() == {"from": "primary"}
+    assert cancelled == ["hedge"]
+    assert policy.stats["hedge_wins"] == 0
+    assert len(policy.slow_primaries) == 1
+
+def test_primary_result_is_returned_when_both_fail():
+    transport, calls, _ = _fake_gemini({"primary": (0.1, 500), "hedge": (0.01, 503)})
+    policy = _policy()
+    
+    response = _post(transport, policy)
+    
+    assert response.status_code == 500
+    assert calls == ["primary", "hedge"]
+    assert policy.stats["hedge_wins"] == 0
+
+def test_no_hedge_without_budget():
+    transport, calls, _ = _fake_gemini({"primary": (0.1, 200), "hedge": (0.01, 200)})
+    policy = _policy(tokens=0.0)
+    
+    response = _post(transport, policy)
+    
+    assert response.json() == {"from": "primary"}
+    assert calls == ["primary"]
+    assert policy.stats["hedges_skipped_budget"] == 1
+    assert policy.stats["hedges_sent"] == 0
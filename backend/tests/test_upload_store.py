@@ -0,0 +1,107 @@
+import asyncio
+import hashlib
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from enhanced_backend import UploadStore
+
+IMAGE = b"\x89PNG\r\n\x1a\n" + bytes(92)
+
+def _store(tmp_path, partial_max_age=3600, max_bytes=1024 * 1024, max_pending=10) -> UploadStore:
+    store = UploadStore(
+        str(tmp_path), max_bytes=max_bytes, blob_max_age=3600,
+        partial_max_age=partial_max_age, max_pending=max_pending,
+    )
+    asyncio.run(store.start())
+    return store
+
+def test_abandoned_partial_upload_is_collected(tmp_path):
+    store = _store(tmp_path, partial_max_age=-1)
+    
+    async def abandon():
+        upload = await store.create_upload(len(IMAGE), None)
+        await store.write_chunk(upload["uploadId"], 0, IMAGE[:20])
+        return upload["uploadId"]
+    
+    upload_id = asyncio.run(abandon())
+    assert upload_id not in store._locks
+    
+    asyncio.run(store.collect_garbage())
+    
+    assert not any(os.path.exists(path) for path in store._partial_paths(upload_id))
+    assert store.stats["gc_deleted_partials"] == 1
+    assert store.snapshot()["pending_uploads"] == 0
+
+def test_recent_partial_upload_survives_collection(tmp_path):
+    store = _store(tmp_path)
+    
+    async def start_upload():
+        upload = await store.create_upload(len(IMAGE), None)
+        await store.write_chunk(upload["uploadId"], 0, IMAGE[:20])
+        return upload["uploadId"]
+    
+    upload_id = asyncio.run(start_upload())
+    asyncio.run(store.collect_garbage())
+    
+    assert all(os.path.exists(path) for path in store._partial_paths(upload_id))
+    assert store.snapshot()["pending_uploads"] == 1
+
+def test_dedupe_ratio_counts_only_bytes_since_startup(tmp_path):
+    store = _store(tmp_path)
+    
+    async def upload_twice():
+        for _ in range(2):
+            upload = await store.create_upload(len(IMAGE), None)
+            result = await store.write_chunk(upload["uploadId"], 0, IMAGE)
+            assert result["complete"]
+    
+    asyncio.run(upload_twice())
+    assert store.snapshot()["dedupe_ratio"] == 2.0
+    
+    # A restarted store has nothing to compare against yet
+    assert _store(tmp_path).snapshot()["dedupe_ratio"] is None
+
+def test_pending_uploads_are_capped(tmp_path):
+    store = _store(tmp_path, max_pending=2)
+    
+    async def open_uploads():
+        for _ in range(2):
+            await store.create_upload(len(IMAGE), None)
+        await store.create_upload(len(IMAGE), None)
+    
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(open_uploads())
+    assert excinfo.value.status_code == 503
+    assert store.snapshot()["pending_uploads"] == 2
+
+def test_partial_uploads_count_against_store_size(tmp_path):
+    store = _store(tmp_path, max_bytes=250)
+    
+    async def reserve():
+        await store.create_upload(200, None)
+        await store.create_upload(100, None)
+    
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(reserve())
+    assert excinfo.value.status_code == 507
+    snapshot = store.snapshot()
+    assert snapshot["pending_bytes"] == 200
+    assert snapshot["occupancy"] == 0.8
+    
+    # Reservations survive a restart
+    assert _store(tmp_path, max_bytes=250).pending_bytes == 200
+
+def test_dedupe_hit_counts_stored_size(tmp_path):
+    store = _store(tmp_path)
+    digest = hashlib.sha256(IMAGE).hexdigest()
+    
+    async def upload_then_claim_larger():
+        upload = await store.create_upload(len(IMAGE), digest)
+        await store.write_chunk(upload["uploadId"], 0, IMAGE)
+        return await store.create_upload(10 * 1024 * 1024, digest)
+    
+    result = asyncio.run(upload_then_claim_larger())
+    assert result["deduplicated"] and result["offset"] == len(IMAGE)
+    assert store.snapshot()["dedupe_ratio"] == 2.0